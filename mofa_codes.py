@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+"""
+mofa_slack_bot.py で使うコード表（国コード・種別コード）。
+
+スクリプトとして直接実行される mofa_slack_bot.py はバイトコードがキャッシュされず、
+毎回ソース全体がコンパイルされる。大きな dict リテラルをこちらに分けておくと、
+import 時に __pycache__ の .pyc が使われるので起動が軽くなる。
+"""
+
+# 国コード → 国名（国または地域名称）
+COUNTRY_CODE_MAP = {
+    "0060": "マレーシア",
+    "0062": "インドネシア",
+    "0063": "フィリピン",
+    "0065": "シンガポール",
+    "0066": "タイ",
+    "0082": "大韓民国／韓国",
+    "0084": "ベトナム",
+    "0086": "中華人民共和国／中国",
+    "0091": "インド",
+    "0092": "パキスタン",
+    "0094": "スリランカ",
+    "0095": "ミャンマー",
+    "0670": "東ティモール",
+    "0673": "ブルネイ",
+    "0850": "北朝鮮",
+    "0852": "香港",
+    "0853": "マカオ",
+    "0855": "カンボジア",
+    "0856": "ラオス",
+    "0880": "バングラデシュ",
+    "0886": "台湾",
+    "0960": "モルディブ",
+    "0975": "ブータン",
+    "0976": "モンゴル",
+    "0977": "ネパール",
+
+    "0061": "オーストラリア",  # 好きな表記にしてOK
+    "0064": "ニュージーランド",
+    "0674": "ナウル",
+    "0675": "パプアニューギニア",
+    "0676": "トンガ",
+    "0677": "ソロモン諸島",
+    "0678": "バヌアツ",
+    "0679": "フィジー",
+    "0680": "パラオ",
+    "0682": "クック諸島",
+    "0683": "ニウエ",
+    "0685": "サモア独立国",
+    "0686": "キリバス",
+    "0687": "ニューカレドニア（仏領）",
+    "0688": "ツバル",
+    "0691": "ミクロネシア",
+    "0692": "マーシャル諸島",
+    "1001": "アメリカ合衆国（北マリアナ諸島）",
+    "1002": "アメリカ合衆国（グアム）",
+    "1684": "サモア（米領）",
+    "9689": "タヒチ（仏領ポリネシア）",
+
+    "1000": "アメリカ合衆国（本土）",
+    "1808": "アメリカ合衆国（ハワイ）",
+    "9001": "カナダ",
+
+    "0051": "ペルー",
+    "0052": "メキシコ",
+    "0053": "キューバ",
+    "0054": "アルゼンチン",
+    "0055": "ブラジル",
+    "0056": "チリ",
+    "0057": "コロンビア",
+    "0058": "ベネズエラ",
+    "0473": "グレナダ",
+    "0501": "ベリーズ",
+    "0502": "グアテマラ",
+    "0503": "エルサルバドル",
+    "0504": "ホンジュラス",
+    "0505": "ニカラグア",
+    "0506": "コスタリカ",
+    "0507": "パナマ",
+    "0509": "ハイチ",
+    "0591": "ボリビア",
+    "0592": "ガイアナ",
+    "0593": "エクアドル",
+    "0595": "パラグアイ",
+    "0597": "スリナム",
+    "0598": "ウルグアイ",
+    "0758": "セントルシア",
+    "0767": "ドミニカ国",
+    "0784": "セントビンセント及びグレナディーン諸島",
+    "0809": "ドミニカ共和国",
+    "0868": "トリニダード・トバゴ",
+    "0869": "セントクリストファー・ネービス",
+    "0876": "ジャマイカ",
+    "1242": "バハマ",
+    "1246": "バルバドス",
+    "1268": "アンティグア・バーブーダ",
+
+    "0007": "カザフスタン",
+    "0030": "ギリシャ",
+    "0031": "オランダ",
+    "0032": "ベルギー",
+    "0033": "フランス",
+    "0034": "スペイン",
+    "0036": "ハンガリー",
+    "0039": "イタリア",
+    "0040": "ルーマニア",
+    "0041": "スイス",
+    "0043": "オーストリア",
+    "0044": "英国",
+    "0045": "デンマーク",
+    "0046": "スウェーデン",
+    "0047": "ノルウェー",
+    "0048": "ポーランド",
+    "0049": "ドイツ",
+    "0351": "ポルトガル",
+    "0352": "ルクセンブルク",
+    "0353": "アイルランド",
+    "0354": "アイスランド",
+    "0355": "アルバニア",
+    "0356": "マルタ",
+    "0357": "キプロス",
+    "0358": "フィンランド",
+    "0359": "ブルガリア",
+    "0370": "リトアニア",
+    "0371": "ラトビア",
+    "0372": "エストニア",
+    "0373": "モルドバ",
+    "0374": "アルメニア",
+    "0375": "ベラルーシ",
+    "0376": "アンドラ",
+    "0377": "モナコ",
+    "0378": "サンマリノ",
+    "0380": "ウクライナ",
+    "0381": "セルビア",
+    "0382": "モンテネグロ",
+    "0385": "クロアチア",
+    "0386": "スロベニア",
+    "0387": "ボスニア・ヘルツェゴビナ",
+    "0389": "北マケドニア",
+    "0420": "チェコ",
+    "0421": "スロバキア",
+    "0423": "リヒテンシュタイン",
+    "0992": "タジキスタン",
+    "0993": "トルクメニスタン",
+    "0994": "アゼルバイジャン",
+    "0995": "ジョージア",
+    "0996": "キルギス",
+    "0998": "ウズベキスタン",
+    "9007": "ロシア",
+    "9039": "バチカン市国",
+    "9381": "コソボ",
+
+    "0090": "トルコ",
+    "0093": "アフガニスタン",
+    "0098": "イラン",
+    "0961": "レバノン",
+    "0962": "ヨルダン",
+    "0963": "シリア",
+    "0964": "イラク",
+    "0965": "クウェート",
+    "0966": "サウジアラビア",
+    "0967": "イエメン",
+    "0968": "オマーン",
+    "0970": "パレスチナ",
+    "0971": "アラブ首長国連邦",
+    "0972": "イスラエル",
+    "0973": "バーレーン",
+    "0974": "カタール",
+
+    "0020": "エジプト",
+    "0027": "南アフリカ共和国",
+    "0211": "南スーダン",
+    "0212": "モロッコ",
+    "0213": "アルジェリア",
+    "0216": "チュニジア",
+    "0218": "リビア",
+    "0220": "ガンビア",
+    "0221": "セネガル",
+    "0222": "モーリタニア",
+    "0223": "マリ",
+    "0224": "ギニア",
+    "0225": "コートジボワール",
+    "0226": "ブルキナファソ",
+    "0227": "ニジェール",
+    "0228": "トーゴ",
+    "0229": "ベナン",
+    "0230": "モーリシャス",
+    "0231": "リベリア",
+    "0232": "シエラレオネ",
+    "0233": "ガーナ",
+    "0234": "ナイジェリア",
+    "0235": "チャド",
+    "0236": "中央アフリカ",
+    "0237": "カメルーン",
+    "0238": "カーボベルデ",
+    "0239": "サントメ・プリンシペ",
+    "0240": "赤道ギニア",
+    "0241": "ガボン",
+    "0242": "コンゴ共和国",
+    "0243": "コンゴ民主共和国",
+    "0244": "アンゴラ",
+    "0245": "ギニアビサウ",
+    "0248": "セーシェル",
+    "0249": "スーダン",
+    "0250": "ルワンダ",
+    "0251": "エチオピア",
+    "0252": "ソマリア",
+    "0253": "ジブチ",
+    "0254": "ケニア",
+    "0255": "タンザニア",
+    "0256": "ウガンダ",
+    "0257": "ブルンジ",
+    "0258": "モザンビーク",
+    "0260": "ザンビア",
+    "0261": "マダガスカル",
+    "0263": "ジンバブエ",
+    "0264": "ナミビア",
+    "0265": "マラウイ",
+    "0266": "レソト",
+    "0267": "ボツワナ",
+    "0268": "エスワティニ",
+    "0269": "コモロ",
+    "0291": "エリトリア",
+    "9212": "西サハラ",
+}
+
+# 種別コード → 種別名
+INFO_TYPE_MAP = {
+    "T40": "危険情報",
+    "T81": "感染症危険情報",
+    "C30": "スポット情報",
+    "C31": "スポット情報(感染症)",
+    "C50": "広域情報",
+    "C51": "広域情報(感染症)",
+    "R10": "領事メール(一般)",
+    "R20": "領事メール(緊急)",
+}
@@ -9,284 +9,147 @@
 ・対象: newarrivalL.xml の全 infoType（T40/T81/C30/C31/C50/C51/R10/R20 等）
 ・GitHub Actions で 5分おき実行を想定
   → 直近 WINDOW_MINUTES 分以内に出たものだけを通知
+  → 通知済みのものは SEEN_DB_PATH（sqlite）に記録し、次回以降は通知しない
 """
 
+import http.client
+import json
 import os
 import requests
-import xml.etree.ElementTree as ET
+import sqlite3
+from lxml import etree as ET
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
+from urllib.parse import urlsplit
 
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
 except ImportError:
     ZoneInfo = None
 
+# 日本時間（毎回 ZoneInfo を引かないよう起動時に1度だけ作る）
+JST = ZoneInfo("Asia/Tokyo") if ZoneInfo is not None else None
+
 # newarrival (軽量版)
 MOFA_NEWARRIVAL_URL = "https://www.ezairyu.mofa.go.jp/opendata/area/newarrivalL.xml"
 
 # 「新着」とみなす時間幅（分）
 WINDOW_MINUTES = 1440
 
+# newarrivalL.xml が新しい順に並んでいる前提で、時間幅より古い <mail> が
+# 出た時点で読み込みを打ち切るか（並び順が保証されないので既定はオフ）
+FEED_NEWEST_FIRST = os.environ.get("MOFA_FEED_NEWEST_FIRST") == "1"
+
 # Slack Webhook URL（GitHub Secret から渡す想定）
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL")
 
-# 国コード → 国名（国または地域名称）
-COUNTRY_CODE_MAP = {
-    "0060": "マレーシア",
-    "0062": "インドネシア",
-    "0063": "フィリピン",
-    "0065": "シンガポール",
-    "0066": "タイ",
-    "0082": "大韓民国／韓国",
-    "0084": "ベトナム",
-    "0086": "中華人民共和国／中国",
-    "0091": "インド",
-    "0092": "パキスタン",
-    "0094": "スリランカ",
-    "0095": "ミャンマー",
-    "0670": "東ティモール",
-    "0673": "ブルネイ",
-    "0850": "北朝鮮",
-    "0852": "香港",
-    "0853": "マカオ",
-    "0855": "カンボジア",
-    "0856": "ラオス",
-    "0880": "バングラデシュ",
-    "0886": "台湾",
-    "0960": "モルディブ",
-    "0975": "ブータン",
-    "0976": "モンゴル",
-    "0977": "ネパール",
-
-    "0061": "オーストラリア",  # 好きな表記にしてOK
-    "0064": "ニュージーランド",
-    "0674": "ナウル",
-    "0675": "パプアニューギニア",
-    "0676": "トンガ",
-    "0677": "ソロモン諸島",
-    "0678": "バヌアツ",
-    "0679": "フィジー",
-    "0680": "パラオ",
-    "0682": "クック諸島",
-    "0683": "ニウエ",
-    "0685": "サモア独立国",
-    "0686": "キリバス",
-    "0687": "ニューカレドニア（仏領）",
-    "0688": "ツバル",
-    "0691": "ミクロネシア",
-    "0692": "マーシャル諸島",
-    "1001": "アメリカ合衆国（北マリアナ諸島）",
-    "1002": "アメリカ合衆国（グアム）",
-    "1684": "サモア（米領）",
-    "9689": "タヒチ（仏領ポリネシア）",
-
-    "1000": "アメリカ合衆国（本土）",
-    "1808": "アメリカ合衆国（ハワイ）",
-    "9001": "カナダ",
-
-    "0051": "ペルー",
-    "0052": "メキシコ",
-    "0053": "キューバ",
-    "0054": "アルゼンチン",
-    "0055": "ブラジル",
-    "0056": "チリ",
-    "0057": "コロンビア",
-    "0058": "ベネズエラ",
-    "0473": "グレナダ",
-    "0501": "ベリーズ",
-    "0502": "グアテマラ",
-    "0503": "エルサルバドル",
-    "0504": "ホンジュラス",
-    "0505": "ニカラグア",
-    "0506": "コスタリカ",
-    "0507": "パナマ",
-    "0509": "ハイチ",
-    "0591": "ボリビア",
-    "0592": "ガイアナ",
-    "0593": "エクアドル",
-    "0595": "パラグアイ",
-    "0597": "スリナム",
-    "0598": "ウルグアイ",
-    "0758": "セントルシア",
-    "0767": "ドミニカ国",
-    "0784": "セントビンセント及びグレナディーン諸島",
-    "0809": "ドミニカ共和国",
-    "0868": "トリニダード・トバゴ",
-    "0869": "セントクリストファー・ネービス",
-    "0876": "ジャマイカ",
-    "1242": "バハマ",
-    "1246": "バルバドス",
-    "1268": "アンティグア・バーブーダ",
-
-    "0007": "カザフスタン",
-    "0030": "ギリシャ",
-    "0031": "オランダ",
-    "0032": "ベルギー",
-    "0033": "フランス",
-    "0034": "スペイン",
-    "0036": "ハンガリー",
-    "0039": "イタリア",
-    "0040": "ルーマニア",
-    "0041": "スイス",
-    "0043": "オーストリア",
-    "0044": "英国",
-    "0045": "デンマーク",
-    "0046": "スウェーデン",
-    "0047": "ノルウェー",
-    "0048": "ポーランド",
-    "0049": "ドイツ",
-    "0351": "ポルトガル",
-    "0352": "ルクセンブルク",
-    "0353": "アイルランド",
-    "0354": "アイスランド",
-    "0355": "アルバニア",
-    "0356": "マルタ",
-    "0357": "キプロス",
-    "0358": "フィンランド",
-    "0359": "ブルガリア",
-    "0370": "リトアニア",
-    "0371": "ラトビア",
-    "0372": "エストニア",
-    "0373": "モルドバ",
-    "0374": "アルメニア",
-    "0375": "ベラルーシ",
-    "0376": "アンドラ",
-    "0377": "モナコ",
-    "0378": "サンマリノ",
-    "0380": "ウクライナ",
-    "0381": "セルビア",
-    "0382": "モンテネグロ",
-    "0385": "クロアチア",
-    "0386": "スロベニア",
-    "0387": "ボスニア・ヘルツェゴビナ",
-    "0389": "北マケドニア",
-    "0420": "チェコ",
-    "0421": "スロバキア",
-    "0423": "リヒテンシュタイン",
-    "0992": "タジキスタン",
-    "0993": "トルクメニスタン",
-    "0994": "アゼルバイジャン",
-    "0995": "ジョージア",
-    "0996": "キルギス",
-    "0998": "ウズベキスタン",
-    "9007": "ロシア",
-    "9039": "バチカン市国",
-    "9381": "コソボ",
-
-    "0090": "トルコ",
-    "0093": "アフガニスタン",
-    "0098": "イラン",
-    "0961": "レバノン",
-    "0962": "ヨルダン",
-    "0963": "シリア",
-    "0964": "イラク",
-    "0965": "クウェート",
-    "0966": "サウジアラビア",
-    "0967": "イエメン",
-    "0968": "オマーン",
-    "0970": "パレスチナ",
-    "0971": "アラブ首長国連邦",
-    "0972": "イスラエル",
-    "0973": "バーレーン",
-    "0974": "カタール",
-
-    "0020": "エジプト",
-    "0027": "南アフリカ共和国",
-    "0211": "南スーダン",
-    "0212": "モロッコ",
-    "0213": "アルジェリア",
-    "0216": "チュニジア",
-    "0218": "リビア",
-    "0220": "ガンビア",
-    "0221": "セネガル",
-    "0222": "モーリタニア",
-    "0223": "マリ",
-    "0224": "ギニア",
-    "0225": "コートジボワール",
-    "0226": "ブルキナファソ",
-    "0227": "ニジェール",
-    "0228": "トーゴ",
-    "0229": "ベナン",
-    "0230": "モーリシャス",
-    "0231": "リベリア",
-    "0232": "シエラレオネ",
-    "0233": "ガーナ",
-    "0234": "ナイジェリア",
-    "0235": "チャド",
-    "0236": "中央アフリカ",
-    "0237": "カメルーン",
-    "0238": "カーボベルデ",
-    "0239": "サントメ・プリンシペ",
-    "0240": "赤道ギニア",
-    "0241": "ガボン",
-    "0242": "コンゴ共和国",
-    "0243": "コンゴ民主共和国",
-    "0244": "アンゴラ",
-    "0245": "ギニアビサウ",
-    "0248": "セーシェル",
-    "0249": "スーダン",
-    "0250": "ルワンダ",
-    "0251": "エチオピア",
-    "0252": "ソマリア",
-    "0253": "ジブチ",
-    "0254": "ケニア",
-    "0255": "タンザニア",
-    "0256": "ウガンダ",
-    "0257": "ブルンジ",
-    "0258": "モザンビーク",
-    "0260": "ザンビア",
-    "0261": "マダガスカル",
-    "0263": "ジンバブエ",
-    "0264": "ナミビア",
-    "0265": "マラウイ",
-    "0266": "レソト",
-    "0267": "ボツワナ",
-    "0268": "エスワティニ",
-    "0269": "コモロ",
-    "0291": "エリトリア",
-    "9212": "西サハラ",
-}
-
-# 種別コード → 種別名
-INFO_TYPE_MAP = {
-    "T40": "危険情報",
-    "T81": "感染症危険情報",
-    "C30": "スポット情報",
-    "C31": "スポット情報(感染症)",
-    "C50": "広域情報",
-    "C51": "広域情報(感染症)",
-    "R10": "領事メール(一般)",
-    "R20": "領事メール(緊急)",
-}
+# 通知済みキーを記録する sqlite DB（GitHub Actions では actions/cache で引き継ぐ）
+SEEN_DB_PATH = os.environ.get(
+    "MOFA_SEEN_DB", os.path.join(os.path.expanduser("~"), ".cache", "mofa", "seen.db")
+)
+
+# XML 取得用の HTTP セッション（keep-alive / gzip 圧縮転送）
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "mofa-slack-bot",
+})
+
+# <mail> 内のレベル系タグ名（レベル1〜4）
+_RISK_TAGS = tuple(f"riskLevel{lv}" for lv in (1, 2, 3, 4))
+_INFECTION_TAGS = tuple(f"infectionLevel{lv}" for lv in (1, 2, 3, 4))
+
+# Slack 表示用のレベル表記（index 0 がレベル1）。表示は高いレベルから並べる
+_L_STRS = ("L1", "L2", "L3", "L4")
+
+
+@dataclass(slots=True)
+class Mail:
+    """newarrivalL.xml の <mail> 1件分"""
+    info_type: str
+    info_name: str
+    info_name_long: str
+    leave_date: str
+    leave_dt: datetime
+    country_name: str
+    country_cd: str
+    area_name: str
+    title: str
+    info_url: str
+    koukan_cd: str
+    koukan_name: str
+    # レベル1〜4 が "Y" かどうか（index 0 がレベル1）
+    risk_level: tuple
+    infection_level: tuple
 
 
 def get_now_jst():
     """JSTの現在時刻を返す"""
-    if ZoneInfo is not None:
-        return datetime.now(ZoneInfo("Asia/Tokyo"))
+    if JST is not None:
+        return datetime.now(JST)
     else:
         return datetime.utcnow()
 
 
 def fetch_mofa_newarrival():
-    """MOFAの新着情報XMLを取得して ElementTree root を返す"""
-    resp = requests.get(MOFA_NEWARRIVAL_URL, timeout=10)
-    resp.raise_for_status()
-    resp.encoding = "utf-8"
-    root = ET.fromstring(resp.text)
-    return root
+    """MOFAの新着情報XMLをストリーミング取得し、<mail> 要素を1件ずつ返すジェネレータ
+
+    ダウンロードしながら逐次パースするので、XML全体をメモリに持たない。
+    tag="mail" で絞り込むため、<mail> 以外の要素は libxml2 側で読み飛ばされる。
+    呼び出し側が次の要素に進んだ時点で、前の <mail> は解放される。
+    """
+    resp = _SESSION.get(MOFA_NEWARRIVAL_URL, stream=True, timeout=10)
+    try:
+        resp.raise_for_status()
+        # gzip 等で返ってきた場合も展開済みのバイト列を読む
+        resp.raw.decode_content = True
+        for _, mail in ET.iterparse(resp.raw, events=("end",), tag="mail"):
+            yield mail
+            release_mail(mail)
+    finally:
+        resp.close()
+
+
+def release_mail(mail):
+    """処理済みの <mail> 要素と、それより前の兄弟要素をツリーから解放する"""
+    mail.clear()
+    parent = mail.getparent()
+    while mail.getprevious() is not None:
+        del parent[0]
+
+
+def child_elements(elem):
+    """直下の子要素を1回の走査で {タグ名: 要素} にまとめる
+
+    同じタグが複数ある場合は findtext と同じく先頭のものを採る。
+    """
+    return {c.tag: c for c in reversed(elem)}
+
+
+def child_text(children, tag):
+    """child_elements() の結果から子要素のテキストを返す（無ければ空文字列）"""
+    c = children.get(tag)
+    if c is None:
+        return ""
+    return c.text or ""
 
 
 def parse_leave_date(leave_date_str: str):
-    """leaveDate（YYYY/MM/DD HH:MM:SS）を datetime(JST想定) に変換"""
-    if not leave_date_str:
+    """leaveDate（YYYY/MM/DD HH:MM:SS）を datetime(JST想定) に変換
+
+    書式が固定なので strptime は使わず、文字列を切り出して直接組み立てる。
+    """
+    s = leave_date_str
+    if not s or len(s) != 19:
         return None
     try:
-        dt = datetime.strptime(leave_date_str, "%Y/%m/%d %H:%M:%S")
-        if ZoneInfo is not None:
-            dt = dt.replace(tzinfo=ZoneInfo("Asia/Tokyo"))
-        return dt
-    except Exception:
+        return datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            tzinfo=JST,
+        )
+    except ValueError:
         return None
 
 
@@ -295,6 +158,9 @@ def build_slack_text(mails):
     if not mails:
         return None
 
+    # コード表は通知するときにしか使わないので、ここで初めて読み込む
+    from mofa_codes import COUNTRY_CODE_MAP, INFO_TYPE_MAP
+
     now_jst = get_now_jst().strftime("%Y-%m-%d %H:%M")
     lines = [
         "*【外務省 海外安全情報オープンデータ 新着】*",
@@ -303,14 +169,14 @@ def build_slack_text(mails):
     ]
 
     # 古い順に並び替え
-    mails = sorted(mails, key=lambda m: m["leave_dt"])
+    mails.sort(key=attrgetter("leave_dt"))
 
     for m in mails:
-        code = m["country_cd"] or ""
+        code = m.country_cd or ""
         country_name_from_map = COUNTRY_CODE_MAP.get(code)
-        base_country_label = f"国コード: {code}" if code else (m["country_name"] or "国不明")
+        base_country_label = f"国コード: {code}" if code else (m.country_name or "国不明")
 
-        paren_country = country_name_from_map or m["country_name"] or ""
+        paren_country = country_name_from_map or m.country_name or ""
 
         # 国コードの後ろに国名
         if paren_country:
@@ -318,8 +184,13 @@ def build_slack_text(mails):
         else:
             first_line_country = f"*{base_country_label}*"
 
-        area = m["area_name"] or ""
-        ld_str = m["leave_dt"].strftime("%Y/%m/%d %H:%M") if m["leave_dt"] else m["leave_date"]
+        area = m.area_name or ""
+        # YYYY/MM/DD HH:MM 固定なので strftime を通さず直接整形する
+        ld = m.leave_dt
+        if ld:
+            ld_str = f"{ld.year:04d}/{ld.month:02d}/{ld.day:02d} {ld.hour:02d}:{ld.minute:02d}"
+        else:
+            ld_str = m.leave_date
 
         # area があるときだけ（地域名）を追加
         if area:
@@ -328,48 +199,71 @@ def build_slack_text(mails):
             location_part = first_line_country
 
         # 種別コード → 種別名
-        info_type_code = m["info_type"]
+        info_type_code = m.info_type
         info_type_label = INFO_TYPE_MAP.get(info_type_code)
         if info_type_label:
             type_text = f"{info_type_code}（{info_type_label}）"
         else:
-            fallback = m["info_name_long"] or m["info_name"] or info_type_code
+            fallback = m.info_name_long or m.info_name or info_type_code
             type_text = f"{info_type_code}（{fallback}）"
 
-        koukan = ""
-        if m.get("koukan_name"):
-            koukan = f"　発出公館: {m['koukan_name']}（{m.get('koukan_cd','')}）\n"
+        lines.append(f"• {location_part}")
+        lines.append(f"　種別: {type_text}")
+        lines.append(f"　日時: {ld_str}")
+        if m.koukan_name:
+            lines.append(f"　発出公館: {m.koukan_name}（{m.koukan_cd}）")
 
         # 危険レベル・感染症レベル（Y/N）
         level_parts = []
-        if any(m.get(f"risk_level{lv}") == "Y" for lv in (1, 2, 3, 4)):
-            lv_str = " / ".join(
-                f"L{lv}" for lv in (4, 3, 2, 1) if m.get(f"risk_level{lv}") == "Y"
-            )
-            level_parts.append(f"危険情報レベル: {lv_str}")
-        if any(m.get(f"infection_level{lv}") == "Y" for lv in (1, 2, 3, 4)):
-            lv_str_inf = " / ".join(
-                f"L{lv}" for lv in (4, 3, 2, 1) if m.get(f"infection_level{lv}") == "Y"
-            )
-            level_parts.append(f"感染症危険レベル: {lv_str_inf}")
-        level_text = ""
+        lv_list = [_L_STRS[i] for i in (3, 2, 1, 0) if m.risk_level[i]]
+        if lv_list:
+            level_parts.append("危険情報レベル: " + " / ".join(lv_list))
+        lv_list_inf = [_L_STRS[i] for i in (3, 2, 1, 0) if m.infection_level[i]]
+        if lv_list_inf:
+            level_parts.append("感染症危険レベル: " + " / ".join(lv_list_inf))
         if level_parts:
-            level_text = "　" + " / ".join(level_parts) + "\n"
-
-        line = (
-            f"• {location_part}\n"
-            f"　種別: {type_text}\n"
-            f"　日時: {ld_str}\n"
-            f"{koukan}"
-            f"{level_text}"
-            f"　タイトル: {m['title']}\n"
-            f"　詳細: {m['info_url']}\n"
-        )
-        lines.append(line)
+            lines.append("　" + " / ".join(level_parts))
+
+        lines.append(f"　タイトル: {m.title}")
+        lines.append(f"　詳細: {m.info_url}")
+        # 1件ごとに空行で区切る
+        lines.append("")
 
     return "\n".join(lines)
 
 
+def open_seen_db(path: str):
+    """通知済みキーを記録する sqlite DB を開く（無ければ作る）"""
+    dirname = os.path.dirname(path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS seen (k TEXT PRIMARY KEY, leave_date TEXT NOT NULL)"
+    )
+    return conn
+
+
+def seen_key(leave_date: str, info_type: str, country_cd: str, title: str):
+    """通知済み判定に使うキー"""
+    return f"{leave_date}|{info_type}|{country_cd}|{title}"
+
+
+def is_seen(conn, key: str):
+    """そのキーが通知済みかどうか"""
+    return conn.execute("SELECT 1 FROM seen WHERE k = ?", (key,)).fetchone() is not None
+
+
+def record_seen(conn, entries, threshold_str: str):
+    """通知したキーを記録し、WINDOW_MINUTES より古いものは削除する
+
+    entries は (キー, leaveDate) のリスト。
+    """
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO seen (k, leave_date) VALUES (?, ?)", entries)
+        conn.execute("DELETE FROM seen WHERE leave_date < ?", (threshold_str,))
+
+
 def post_to_slack(text: str):
     """Webhook経由でSlackに投稿"""
     if not SLACK_WEBHOOK_URL:
@@ -378,70 +272,125 @@ def post_to_slack(text: str):
     payload = {
         "text": text,
     }
-    resp = requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
-    resp.raise_for_status()
+    # 日本語を \uXXXX にエスケープせず、そのまま UTF-8 のバイト列に1回だけ変換する
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    # 1回きりの小さな POST なので requests を通さず http.client で直接送る
+    url = urlsplit(SLACK_WEBHOOK_URL)
+    path = url.path or "/"
+    if url.query:
+        path = f"{path}?{url.query}"
+    conn = http.client.HTTPSConnection(url.netloc, timeout=10)
+    try:
+        conn.request("POST", path, body=body, headers={"Content-Type": "application/json; charset=utf-8"})
+        resp = conn.getresponse()
+        resp_body = resp.read().decode("utf-8", "replace")
+    finally:
+        conn.close()
 
+    if not 200 <= resp.status < 300:
+        raise RuntimeError(f"Slack への投稿に失敗しました: {resp.status} {resp_body}")
 
-def main():
-    root = fetch_mofa_newarrival()
-    now_jst = get_now_jst()
-    threshold = now_jst - timedelta(minutes=WINDOW_MINUTES)
 
+def collect_new_mails(mails, seen_db, threshold, threshold_str):
+    """fetch_mofa_newarrival() の <mail> から、未通知かつ WINDOW_MINUTES 以内のものを集める
+
+    (Mail のリスト, record_seen() に渡す (キー, leaveDate) のリスト) を返す。
+    """
     target_mails = []
+    new_entries = []
 
-    for mail in root.findall(".//mail"):
-        info_type = mail.findtext("infoType", default="")
-        info_name = mail.findtext("infoName", default="")
-        info_name_long = mail.findtext("infoNameLong", default="")
+    for mail in mails:
         leave_date = mail.findtext("leaveDate", default="")
-        leave_dt = parse_leave_date(leave_date)
 
-        # WINDOW_MINUTES 以内の新着だけ拾う
+        # WINDOW_MINUTES 以内の新着だけ拾う（古いものは datetime を作らずに捨てる）
+        if not leave_date:
+            continue
+        if leave_date < threshold_str:
+            if FEED_NEWEST_FIRST:
+                # 以降はすべてこれより古いので、残りはダウンロードもしない
+                break
+            continue
+
+        leave_dt = parse_leave_date(leave_date)
         if leave_dt is None or leave_dt < threshold:
             continue
 
-        country_name = mail.findtext("./country/name", default="")
-        country_cd = mail.findtext("./country/cd", default="")
-        area_name = mail.findtext("./area/name", default="")
-        title = mail.findtext("title", default="")
-        info_url = mail.findtext("infoUrl", default="")
-        koukan_cd = mail.findtext("koukanCd", default="")
-        koukan_name = mail.findtext("koukanName", default="")
-
-        # 危険レベル / 感染症レベル（Y/N）
-        risk_levels = {lv: mail.findtext(f"riskLevel{lv}", default="") for lv in (1, 2, 3, 4)}
-        infection_levels = {lv: mail.findtext(f"infectionLevel{lv}", default="") for lv in (1, 2, 3, 4)}
-
-        obj = {
-            "info_type": info_type,
-            "info_name": info_name,
-            "info_name_long": info_name_long,
-            "leave_date": leave_date,
-            "leave_dt": leave_dt,
-            "country_name": country_name,
-            "country_cd": country_cd,
-            "area_name": area_name,
-            "title": title,
-            "info_url": info_url,
-            "koukan_cd": koukan_cd,
-            "koukan_name": koukan_name,
-        }
-
-        for lv, val in risk_levels.items():
-            obj[f"risk_level{lv}"] = val
-        for lv, val in infection_levels.items():
-            obj[f"infection_level{lv}"] = val
-
-        target_mails.append(obj)
-
-    if not target_mails:
-        print("新着情報（海外安全情報・在外公館メール）はありませんでした。")
-        return
-
-    text = build_slack_text(target_mails)
-    if text:
-        post_to_slack(text)
-        print(f"{len(target_mails)} 件の情報を Slack に送信しました。")
+        # 以降のフィールドは子要素を1回だけ走査して取り出す
+        children = child_elements(mail)
+        info_type = child_text(children, "infoType")
+        info_name = child_text(children, "infoName")
+        info_name_long = child_text(children, "infoNameLong")
+
+        country = children.get("country")
+        country_children = child_elements(country) if country is not None else {}
+        area = children.get("area")
+        area_children = child_elements(area) if area is not None else {}
+        country_name = child_text(country_children, "name")
+        country_cd = child_text(country_children, "cd")
+        area_name = child_text(area_children, "name")
+
+        title = child_text(children, "title")
+        info_url = child_text(children, "infoUrl")
+        koukan_cd = child_text(children, "koukanCd")
+        koukan_name = child_text(children, "koukanName")
+
+        # 前回までに通知済みのものは飛ばす
+        key = seen_key(leave_date, info_type, country_cd, title)
+        if is_seen(seen_db, key):
+            continue
+
+        # 危険レベル / 感染症レベル（Y/N → bool）
+        risk_level = tuple(child_text(children, t) == "Y" for t in _RISK_TAGS)
+        infection_level = tuple(child_text(children, t) == "Y" for t in _INFECTION_TAGS)
+
+        target_mails.append(Mail(
+            info_type=info_type,
+            info_name=info_name,
+            info_name_long=info_name_long,
+            leave_date=leave_date,
+            leave_dt=leave_dt,
+            country_name=country_name,
+            country_cd=country_cd,
+            area_name=area_name,
+            title=title,
+            info_url=info_url,
+            koukan_cd=koukan_cd,
+            koukan_name=koukan_name,
+            risk_level=risk_level,
+            infection_level=infection_level,
+        ))
+        new_entries.append((key, leave_date))
+
+    return target_mails, new_entries
+
+
+def main():
+    now_jst = get_now_jst()
+    threshold = now_jst - timedelta(minutes=WINDOW_MINUTES)
+    # leaveDate は YYYY/MM/DD HH:MM:SS 固定なので、文字列のまま大小比較できる
+    threshold_str = threshold.strftime("%Y/%m/%d %H:%M:%S")
+
+    seen_db = open_seen_db(SEEN_DB_PATH)
+    try:
+        # ジェネレータを変数に残さないことで、途中で打ち切ったときも接続がすぐ閉じられる
+        target_mails, new_entries = collect_new_mails(
+            fetch_mofa_newarrival(), seen_db, threshold, threshold_str
+        )
+
+        if not target_mails:
+            record_seen(seen_db, [], threshold_str)
+            print("新着情報（海外安全情報・在外公館メール）はありませんでした。")
+            return
+
+        text = build_slack_text(target_mails)
+        if text:
+            post_to_slack(text)
+            # 投稿に成功したものだけ通知済みにする
+            record_seen(seen_db, new_entries, threshold_str)
+            print(f"{len(target_mails)} 件の情報を Slack に送信しました。")
+    finally:
+        seen_db.close()
 
 
 if __name__ == "__main__":